@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Native single-call kernel for classify_marine_health.
+
+Build in place with:  python setup.py build_ext --inplace
+Validation stays in marine_health_testing.py; inputs here are assumed finite
+and within physical ranges.
+"""
+
+
+cdef inline int _sev_temp(double t):
+    if 24 <= t <= 28:
+        return 0
+    if 22 <= t <= 30:
+        return 1
+    return 2
+
+
+cdef inline int _sev_sal(double s):
+    if 30 <= s <= 35:
+        return 0
+    if 28 <= s <= 37:
+        return 1
+    return 2
+
+
+cdef inline int _sev_do(double o):
+    if o >= 6:
+        return 0
+    if o >= 4:
+        return 1
+    return 2
+
+
+cdef inline int _sev_nh3(double a):
+    if a <= 0.02:
+        return 0
+    if a <= 0.05:
+        return 1
+    return 2
+
+
+cpdef tuple classify(double t, double s, double o, double a):
+    """
+    Return (risk_code, factor_bitmask).
+    risk_code: 0=low, 1=medium, 2=high.
+    factor_bitmask: bit 0=temp, 1=salinity, 2=dissolved_oxygen, 3=ammonia (set if not safe).
+    """
+    cdef int t_sev = _sev_temp(t)
+    cdef int s_sev = _sev_sal(s)
+    cdef int o_sev = _sev_do(o)
+    cdef int a_sev = _sev_nh3(a)
+    cdef int risk = t_sev
+    if s_sev > risk:
+        risk = s_sev
+    if o_sev > risk:
+        risk = o_sev
+    if a_sev > risk:
+        risk = a_sev
+    cdef int mask = (t_sev != 0) | ((s_sev != 0) << 1) | ((o_sev != 0) << 2) | ((a_sev != 0) << 3)
+    return risk, mask
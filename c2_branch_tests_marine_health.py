@@ -6,70 +6,75 @@ C2 (Branch/Decision) tests for the marine health classifier.
 """
 
 from typing import Dict, Any, List, Tuple
-import math
-import json
 
-def classify_marine_health(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Dict[str, Any]:
-    for name, val in [('temp_c', temp_c), ('sal_psu', sal_psu), ('do_mgL', do_mgL), ('nh3_mgL', nh3_mgL)]:
-        if not isinstance(val, (int, float)) or math.isnan(val) or math.isinf(val):
-            raise ValueError(f"{name} must be a finite number.")
+_FACTOR_NAMES = ("temp", "salinity", "dissolved_oxygen", "ammonia")
+
+# Bucket severities: 0=safe, 1=moderate, 2=high
+def _bucket_temp(t: float) -> int:
+    if 24 <= t <= 28:
+        return 0
+    if (22 <= t < 24) or (28 < t <= 30):
+        return 1
+    return 2
+
+def _bucket_sal(s: float) -> int:
+    if 30 <= s <= 35:
+        return 0
+    if (28 <= s < 30) or (35 < s <= 37):
+        return 1
+    return 2
+
+def _bucket_do(o: float) -> int:
+    if o >= 6:
+        return 0
+    if o < 4:
+        return 2
+    return 1
+
+def _bucket_nh3(a: float) -> int:
+    if a <= 0.02:
+        return 0
+    if a > 0.05:
+        return 2
+    return 1
+
+_INF = float("inf")
+_NUM_TYPES = (int, float)
+_ERR = {name: f"{name} must be a finite number." for name in ("temp_c", "sal_psu", "do_mgL", "nh3_mgL")}
+
+def _check(v, name: str) -> None:
+    if (type(v) not in _NUM_TYPES and not isinstance(v, _NUM_TYPES)) or v != v or v == _INF or v == -_INF:
+        raise ValueError(_ERR[name])
+
+def _validate(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> None:
+    _check(temp_c, "temp_c")
+    _check(sal_psu, "sal_psu")
+    _check(do_mgL, "do_mgL")
+    _check(nh3_mgL, "nh3_mgL")
     if temp_c <= 0 or sal_psu <= 0 or do_mgL <= 0 or nh3_mgL < 0:
         raise ValueError("Invalid physical ranges.")
 
-    def bucket_temp(t: float) -> str:
-        if 24 <= t <= 28:
-            return "safe"
-        if (22 <= t < 24) or (28 < t <= 30):
-            return "moderate"
-        return "high"
-    def bucket_sal(s: float) -> str:
-        if 30 <= s <= 35:
-            return "safe"
-        if (28 <= s < 30) or (35 < s <= 37):
-            return "moderate"
-        return "high"
-    def bucket_do(o: float) -> str:
-        if o >= 6:
-            return "safe"
-        if o < 4:
-            return "high"
-        return "moderate"
-    def bucket_nh3(a: float) -> str:
-        if a <= 0.02:
-            return "safe"
-        if a > 0.05:
-            return "high"
-        return "moderate"
-
-    factors = {
-        "temp": bucket_temp(temp_c),
-        "salinity": bucket_sal(sal_psu),
-        "dissolved_oxygen": bucket_do(do_mgL),
-        "ammonia": bucket_nh3(nh3_mgL),
-    }
-    if "high" in factors.values():
-        risk = "high"
-    elif "moderate" in factors.values():
-        risk = "medium"
-    else:
-        risk = "low"
-    return {"risk": risk, "factors": [k for k,v in factors.items() if v != "safe"]}
+def classify_marine_health(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Dict[str, Any]:
+    _validate(temp_c, sal_psu, do_mgL, nh3_mgL)
+    sevs = (_bucket_temp(temp_c), _bucket_sal(sal_psu), _bucket_do(do_mgL), _bucket_nh3(nh3_mgL))
+    t, s, o, n = sevs
+    bits = t | s | o | n
+    if not bits:
+        return {"risk": "low", "factors": []}
+    risk = "high" if bits & 2 else "medium"
+    return {"risk": risk, "factors": [_FACTOR_NAMES[i] for i, v in enumerate(sevs) if v]}
 
-DECISIONS = [
+DECISIONS = (
     "VAL_temp_gt0","VAL_sal_gt0","VAL_do_gt0","VAL_nh3_ge0",
     "T_safe_24_28","T_moderate_22_24_or_28_30",
     "S_safe_30_35","S_moderate_28_30_or_35_37",
     "DO_safe_ge6","DO_high_lt4",
     "NH3_safe_le_0_02","NH3_high_gt_0_05",
     "AGG_has_high","AGG_has_moderate",
-]
+)
+_ALL_DECISIONS = (1 << len(DECISIONS)) - 1
 
 def eval_decisions(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float):
-    d = {}
-    d["VAL_temp_gt0"] = (temp_c > 0)
-    d["VAL_sal_gt0"]  = (sal_psu > 0)
-    d["VAL_do_gt0"]   = (do_mgL > 0)
-    d["VAL_nh3_ge0"]  = (nh3_mgL >= 0)
     t_safe = (24 <= temp_c <= 28)
     t_mod  = ((22 <= temp_c < 24) or (28 < temp_c <= 30))
     s_safe = (30 <= sal_psu <= 35)
@@ -78,19 +83,27 @@ def eval_decisions(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float)
     do_high = (do_mgL < 4)
     nh3_safe = (nh3_mgL <= 0.02)
     nh3_high = (nh3_mgL > 0.05)
-    d["T_safe_24_28"] = t_safe
-    d["T_moderate_22_24_or_28_30"] = t_mod
-    d["S_safe_30_35"] = s_safe
-    d["S_moderate_28_30_or_35_37"] = s_mod
-    d["DO_safe_ge6"] = do_safe
-    d["DO_high_lt4"] = do_high
-    d["NH3_safe_le_0_02"] = nh3_safe
-    d["NH3_high_gt_0_05"] = nh3_high
     any_high = ((not t_safe and not t_mod) or (not s_safe and not s_mod) or do_high or (not nh3_safe and nh3_high))
     any_mod = (not any_high) and (t_mod or s_mod or (not do_safe and not do_high) or (not nh3_safe and not nh3_high))
-    d["AGG_has_high"] = any_high
-    d["AGG_has_moderate"] = any_mod
-    return d
+    return {
+        "VAL_temp_gt0": (temp_c > 0),
+        "VAL_sal_gt0": (sal_psu > 0),
+        "VAL_do_gt0": (do_mgL > 0),
+        "VAL_nh3_ge0": (nh3_mgL >= 0),
+        "T_safe_24_28": t_safe,
+        "T_moderate_22_24_or_28_30": t_mod,
+        "S_safe_30_35": s_safe,
+        "S_moderate_28_30_or_35_37": s_mod,
+        "DO_safe_ge6": do_safe,
+        "DO_high_lt4": do_high,
+        "NH3_safe_le_0_02": nh3_safe,
+        "NH3_high_gt_0_05": nh3_high,
+        "AGG_has_high": any_high,
+        "AGG_has_moderate": any_mod,
+    }
+
+# Same text json.dumps produces for the four numeric inputs
+_INPUT_FMT = '{{"temp_c": {temp_c}, "sal_psu": {sal_psu}, "do_mgL": {do_mgL}, "nh3_mgL": {nh3_mgL}}}'
 
 TESTS = [
     ("ALL_SAFE", dict(temp_c=26.0, sal_psu=32.0, do_mgL=7.0,  nh3_mgL=0.005), "low"),
@@ -103,6 +116,8 @@ TESTS = [
     ("NH3_MOD",  dict(temp_c=26.0, sal_psu=32.0, do_mgL=7.0,  nh3_mgL=0.03),  "medium"),
     ("NH3_HIGH", dict(temp_c=26.0, sal_psu=32.0, do_mgL=7.0,  nh3_mgL=0.06),  "high"),
 ]
+# Log strings are formatted once here: (name, inputs, inputs_str, expected)
+TESTS = [(name, inp, _INPUT_FMT.format(**inp), expected) for name, inp, expected in TESTS]
 
 ERROR_TESTS = [
     ("VAL_temp_le0", dict(temp_c=0.0, sal_psu=32.0, do_mgL=7.0, nh3_mgL=0.0)),
@@ -110,45 +125,54 @@ ERROR_TESTS = [
     ("VAL_do_le0",   dict(temp_c=26.0, sal_psu=32.0, do_mgL=0.0, nh3_mgL=0.0)),
     ("VAL_nh3_lt0",  dict(temp_c=26.0, sal_psu=32.0, do_mgL=7.0, nh3_mgL=-0.001)),
 ]
+ERROR_TESTS = [(name, inp, _INPUT_FMT.format(**inp)) for name, inp in ERROR_TESTS]
+
+def _record_coverage(dec: Dict[str, bool], seen_true: int, seen_false: int) -> Tuple[int, int]:
+    # Bit i is DECISIONS[i]; a decision missing from dec raises KeyError
+    for i, name in enumerate(DECISIONS):
+        if dec[name]:
+            seen_true |= 1 << i
+        else:
+            seen_false |= 1 << i
+    return seen_true, seen_false
 
 def main():
-    cov = {name: set() for name in DECISIONS}
+    # Bit i of seen_true/seen_false is set once DECISIONS[i] evaluated True/False
+    seen_true = seen_false = 0
     passed = 0
 
     print("[RUN] C2 branch suite")
-    for name, inp, expected in TESTS:
-        out = classify_marine_health(**inp)
-        ok = (out["risk"] == expected)
+    for name, inp, inp_str, expected in TESTS:
+        risk = classify_marine_health(**inp)["risk"]
+        ok = (risk == expected)
         passed += int(ok)
         dec = eval_decisions(**inp)
-        for k,v in dec.items():
-            cov[k].add(bool(v))
-        print(f"- {name:10s} inputs={json.dumps(inp)} => risk={out['risk']} expected={expected} [{'PASS' if ok else 'FAIL'}]")
+        seen_true, seen_false = _record_coverage(dec, seen_true, seen_false)
+        print(f"- {name:10s} inputs={inp_str} => risk={risk} expected={expected} [{'PASS' if ok else 'FAIL'}]")
 
-    for name, inp in ERROR_TESTS:
+    for name, inp, inp_str in ERROR_TESTS:
         try:
             classify_marine_health(**inp)
             ok = False
         except ValueError:
             ok = True
         passed += int(ok)
+        # Rejected inputs still count towards coverage of the VAL_* decisions
         dec = eval_decisions(**inp)
-        for k,v in dec.items():
-            cov[k].add(bool(v))
-        print(f"- {name:10s} inputs={json.dumps(inp)} => raises ValueError [{'PASS' if ok else 'FAIL'}]")
+        seen_true, seen_false = _record_coverage(dec, seen_true, seen_false)
+        print(f"- {name:10s} inputs={inp_str} => raises ValueError [{'PASS' if ok else 'FAIL'}]")
 
     total = len(TESTS) + len(ERROR_TESTS)
     print(f"\n[SUMMARY] {passed}/{total} tests passed.")
     print("\n[DECISION COVERAGE — C2]\n(decision : seen True?  seen False?)")
-    for name in DECISIONS:
-        tf = cov[name]
-        print(f"  {name:28s}:  {'T' if True in tf else '-'}       {'F' if False in tf else '-'}")
+    for i, name in enumerate(DECISIONS):
+        print(f"  {name:28s}:  {'T' if seen_true >> i & 1 else '-'}       {'F' if seen_false >> i & 1 else '-'}")
 
-    both = [n for n in DECISIONS if True in cov[n] and False in cov[n]]
-    missing = [n for n in DECISIONS if n not in both]
-    if not missing:
+    missing_mask = _ALL_DECISIONS & ~(seen_true & seen_false)
+    if not missing_mask:
         print("\n[RESULT] C2 achieved for all tracked decisions.")
     else:
+        missing = [n for i, n in enumerate(DECISIONS) if missing_mask >> i & 1]
         print("\n[RESULT] C2 NOT fully achieved for:", ", ".join(missing))
 
 if __name__ == "__main__":
@@ -10,69 +10,236 @@ Outputs:
 - Prints unittest results.
 - Writes a CSV "decision_table_marine_health.csv" with columns:
   ID, Case, Inputs, Expected Output, Actual Output, Result
+Flags:
+- --regenerate: rewrite both CSVs and print the golden hash to store in _GOLDEN_HASH.
+- --verify-only: check the existing CSVs against _GOLDEN_HASH without running the SUT
+  (recorded results are trusted, so SUT regressions need --regenerate or the tests).
 """
 
-from typing import Dict, Any, List, Dict as Dct
+from typing import Dict, Any, List, Tuple, Dict as Dct
+from functools import lru_cache
 import math
+from bisect import bisect_left, bisect_right
+import argparse
 import csv
+import hashlib
 import unittest
-import json
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the CSV writers fall back to the scalar SUT
+    np = None
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # Numba is optional; the batch path falls back to np.searchsorted
+    _HAS_NUMBA = False
+
+    def njit(**_kwargs):
+        return lambda f: f
+
+try:
+    # Optional Cython kernel, built with `python setup.py build_ext --inplace`
+    from _marine_health import classify as _cclassify
+except ImportError:
+    _cclassify = None
 
 # ---------- System Under Test ----------
+# Bucket thresholds as sorted bins + lookup tables: bisect gives the bin index,
+# the LUT maps it to a severity code (0=safe, 1=moderate, 2=high).
+# Temperature/salinity upper bounds are inclusive, so those edges are nudged
+# to the next float above to keep `<=`.
+_INF = float("inf")
+_T_BINS = (22, 24, math.nextafter(28, _INF), math.nextafter(30, _INF))
+_T_LUT = (2, 1, 0, 1, 2)
+_S_BINS = (28, 30, math.nextafter(35, _INF), math.nextafter(37, _INF))
+_S_LUT = (2, 1, 0, 1, 2)
+_DO_BINS = (4, 6)
+_DO_LUT = (2, 1, 0)
+_NH3_BINS = (0.02, 0.05)  # (lo, hi] intervals -> bisect_left
+_NH3_LUT = (0, 1, 2)
+_RISK_LEVELS = ("low", "medium", "high")
+_FACTOR_NAMES = ("temp", "salinity", "dissolved_oxygen", "ammonia")
+# Factor names for each 4-bit mask returned by the native kernel
+_FACTORS_BY_MASK = tuple(
+    tuple(n for i, n in enumerate(_FACTOR_NAMES) if mask >> i & 1) for mask in range(16)
+)
+
+_NUM_TYPES = (int, float)
+_ERR = {name: f"{name} must be a finite number." for name in ("temp_c", "sal_psu", "do_mgL", "nh3_mgL")}
+
+
+def _check(v, name: str) -> None:
+    # Exact-type test first; isinstance only for subclasses (bool, numpy floats).
+    # v != v is the NaN test. Plain comparisons also keep NumPy scalars from
+    # emitting RuntimeWarnings, which inf - inf would.
+    if (type(v) not in _NUM_TYPES and not isinstance(v, _NUM_TYPES)) or v != v or v == _INF or v == -_INF:
+        raise ValueError(_ERR[name])
+    if type(v) is not float:
+        # Ints beyond double range would overflow in the native kernel;
+        # reject them here so every path fails the same way.
+        try:
+            float(v)
+        except OverflowError:
+            raise ValueError(_ERR[name]) from None
+
+
+def _validate(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> None:
+    _check(temp_c, "temp_c")
+    _check(sal_psu, "sal_psu")
+    _check(do_mgL, "do_mgL")
+    _check(nh3_mgL, "nh3_mgL")
+    if temp_c <= 0 or sal_psu <= 0 or do_mgL <= 0 or nh3_mgL < 0:
+        raise ValueError("Invalid physical ranges.")
+
+
+def _severities(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Tuple[int, int, int, int]:
+    """Per-factor severity codes (0=safe, 1=moderate, 2=high) for validated inputs."""
+    return (
+        _T_LUT[bisect_right(_T_BINS, temp_c)],
+        _S_LUT[bisect_right(_S_BINS, sal_psu)],
+        _DO_LUT[bisect_right(_DO_BINS, do_mgL)],
+        _NH3_LUT[bisect_left(_NH3_BINS, nh3_mgL)],
+    )
+
+
+def _risk_code(sevs: Tuple[int, int, int, int]) -> int:
+    """Overall risk as an index into _RISK_LEVELS (0=low, 1=medium, 2=high)."""
+    # Severities are 0/1/2, so OR-ing them sets bit 1 iff any factor is high
+    t, s, o, n = sevs
+    bits = t | s | o | n
+    return 2 if bits & 2 else bits
+
+
+def _classify_risk_code(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> int:
+    """
+    Same validation and risk as classify_marine_health, but no factors and no dict.
+    """
+    _validate(temp_c, sal_psu, do_mgL, nh3_mgL)
+    return _risk_code(_severities(temp_c, sal_psu, do_mgL, nh3_mgL))
+
+
+def _classify_python(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Tuple[str, Tuple[str, ...]]:
+    """Pure-Python (risk, factors) for already-validated inputs."""
+    sevs = _severities(temp_c, sal_psu, do_mgL, nh3_mgL)
+    code = _risk_code(sevs)
+    if not code:
+        return "low", ()
+    return _RISK_LEVELS[code], tuple(_FACTOR_NAMES[i] for i, v in enumerate(sevs) if v)
+
+
+@lru_cache(maxsize=1024)
+def _classify_cached(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Tuple[str, Tuple[str, ...]]:
+    """Memoized (risk, factors) for already-validated inputs; uses the native kernel when built."""
+    if _cclassify is not None:
+        code, mask = _cclassify(temp_c, sal_psu, do_mgL, nh3_mgL)
+        return _RISK_LEVELS[code], _FACTORS_BY_MASK[mask]
+    return _classify_python(temp_c, sal_psu, do_mgL, nh3_mgL)
+
+
 def classify_marine_health(temp_c: float, sal_psu: float, do_mgL: float, nh3_mgL: float) -> Dict[str, Any]:
     """
     Classify marine fish health risk for a tropical marine aquarium (black-box).
     """
-    # Validation
-    for name, val in [('temp_c', temp_c), ('sal_psu', sal_psu), ('do_mgL', do_mgL), ('nh3_mgL', nh3_mgL)]:
-        if not isinstance(val, (int, float)) or math.isnan(val) or math.isinf(val):
-            raise ValueError(f"{name} must be a finite number.")
-    if temp_c <= 0 or sal_psu <= 0 or do_mgL <= 0 or nh3_mgL < 0:
-        raise ValueError("Invalid physical ranges.")
+    # Validation (outside the cache so unhashable inputs still raise ValueError)
+    _validate(temp_c, sal_psu, do_mgL, nh3_mgL)
 
-    def bucket_temp(t: float) -> str:
-        if 24 <= t <= 28:
-            return "safe"
-        if (22 <= t < 24) or (28 < t <= 30):
-            return "moderate"
-        return "high"
+    risk, factors = _classify_cached(temp_c, sal_psu, do_mgL, nh3_mgL)
+    return {"risk": risk, "factors": list(factors)}
 
-    def bucket_sal(s: float) -> str:
-        if 30 <= s <= 35:
-            return "safe"
-        if (28 <= s < 30) or (35 < s <= 37):
-            return "moderate"
-        return "high"
 
-    def bucket_do(o: float) -> str:
-        if o >= 6:
-            return "safe"
-        if o < 4:
-            return "high"
-        return "moderate"  # 4–<6
+if np is not None:
+    _T_LUT_ARR = np.array(_T_LUT, dtype=np.int8)
+    _S_LUT_ARR = np.array(_S_LUT, dtype=np.int8)
+    _DO_LUT_ARR = np.array(_DO_LUT, dtype=np.int8)
+    _NH3_LUT_ARR = np.array(_NH3_LUT, dtype=np.int8)
+    _RISK_ARR = np.array(_RISK_LEVELS)
 
-    def bucket_nh3(a: float) -> str:
+
+@njit(cache=True, fastmath=True)
+def _classify_batch(temp_c, sal_psu, do_mgL, nh3_mgL, out):
+    """JIT batch worker: writes the max per-row severity (0/1/2) into `out`."""
+    for i in range(out.shape[0]):
+        t = temp_c[i]
+        if 24 <= t <= 28:
+            t_sev = 0
+        elif 22 <= t <= 30:
+            t_sev = 1
+        else:
+            t_sev = 2
+        s = sal_psu[i]
+        if 30 <= s <= 35:
+            s_sev = 0
+        elif 28 <= s <= 37:
+            s_sev = 1
+        else:
+            s_sev = 2
+        o = do_mgL[i]
+        if o >= 6:
+            o_sev = 0
+        elif o >= 4:
+            o_sev = 1
+        else:
+            o_sev = 2
+        a = nh3_mgL[i]
         if a <= 0.02:
-            return "safe"
-        if a > 0.05:
-            return "high"
-        return "moderate"  # (0.02, 0.05]
-
-    factors = {
-        "temp": bucket_temp(temp_c),
-        "salinity": bucket_sal(sal_psu),
-        "dissolved_oxygen": bucket_do(do_mgL),
-        "ammonia": bucket_nh3(nh3_mgL),
-    }
-
-    if "high" in factors.values():
-        risk = "high"
-    elif "moderate" in factors.values():
-        risk = "medium"
+            a_sev = 0
+        elif a <= 0.05:
+            a_sev = 1
+        else:
+            a_sev = 2
+        out[i] = max(t_sev, s_sev, o_sev, a_sev)
+
+
+def _classify_batch_np(temp_c, sal_psu, do_mgL, nh3_mgL):
+    """NumPy batch worker: max per-row severity (0/1/2) as an int8 array."""
+    # Per-factor severity: 0=safe, 1=moderate, 2=high
+    sev = np.stack([
+        _T_LUT_ARR[np.searchsorted(_T_BINS, temp_c, side="right")],
+        _S_LUT_ARR[np.searchsorted(_S_BINS, sal_psu, side="right")],
+        _DO_LUT_ARR[np.searchsorted(_DO_BINS, do_mgL, side="right")],
+        _NH3_LUT_ARR[np.searchsorted(_NH3_BINS, nh3_mgL, side="left")],
+    ], axis=1)
+    return sev.max(axis=1)
+
+
+def classify_marine_health_batch(temp_c, sal_psu, do_mgL, nh3_mgL):
+    """
+    Vectorized risk classification over equal-length arrays (requires NumPy).
+    Returns an array of risk strings ("low"/"medium"/"high"), one per row.
+    Inputs are assumed to be already valid (see classify_marine_health).
+    """
+    t = np.asarray(temp_c, dtype=np.float64)
+    s = np.asarray(sal_psu, dtype=np.float64)
+    o = np.asarray(do_mgL, dtype=np.float64)
+    a = np.asarray(nh3_mgL, dtype=np.float64)
+
+    if _HAS_NUMBA:
+        codes = np.empty(t.shape[0], dtype=np.int8)
+        _classify_batch(t, s, o, a, codes)
     else:
-        risk = "low"
+        codes = _classify_batch_np(t, s, o, a)
+    return _RISK_ARR[codes]
 
-    return {"risk": risk, "factors": [k for k, v in factors.items() if v != "safe"]}
+
+def _batch_risks(rows: List[Dct[str, Any]]) -> List[str]:
+    """
+    Actual risk for every table row, batched when NumPy (and Numba) are available.
+    Every row is validated first, so invalid inputs raise ValueError exactly as
+    classify_marine_health would instead of being classified by the batch path.
+    """
+    if np is None:
+        return [_RISK_LEVELS[_classify_risk_code(r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"])] for r in rows]
+    for r in rows:
+        _validate(r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"])
+    n = len(rows)
+    return classify_marine_health_batch(
+        np.fromiter((r["Temp_C"] for r in rows), dtype=np.float64, count=n),
+        np.fromiter((r["Sal_PSU"] for r in rows), dtype=np.float64, count=n),
+        np.fromiter((r["DO_mgL"] for r in rows), dtype=np.float64, count=n),
+        np.fromiter((r["NH3_mgL"] for r in rows), dtype=np.float64, count=n),
+    ).tolist()
 
 
 # ---------- Decision Table (Representative Cases) ----------
@@ -112,39 +279,45 @@ def decision_table_rows() -> List[Dct[str, Any]]:
     return rows
 
 
+_CSV_HEADER = ("ID", "Case", "Inputs", "Expected Output", "Actual Output", "Result")
+# Same text json.dumps produces for the four numeric inputs (str(float) == repr(float))
+_INPUT_FMT = '{{"temp_c": {}, "sal_psu": {}, "do_mgL": {}, "nh3_mgL": {}}}'
+
+
+def _write_results_csv(path: str, rows: List[Dct[str, Any]]) -> str:
+    """Classify all rows up front, then emit header + rows in one writerows call."""
+    actuals = _batch_risks(rows)
+    all_rows = [
+        (
+            i,
+            r["Case"],
+            _INPUT_FMT.format(r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"]),
+            r["Expected_Risk"],
+            actual,
+            "Pass" if r["Expected_Risk"] == actual else "Fail",
+        )
+        for i, (r, actual) in enumerate(zip(rows, actuals), start=1)
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(all_rows)
+    return path
+
+
 def write_decision_table_csv(path: str = "decision_table_marine_health.csv"):
     """
     Write CSV with columns:
     ID, Case, Inputs, Expected Output, Actual Output, Result
     - Inputs is a compact JSON string of the four inputs.
     - Expected Output is the expected risk level (string).
-    - Actual Output is the actual risk level returned by SUT.
+    - Actual Output is the risk level computed for the row: by
+      classify_marine_health_batch when NumPy is available (a separate
+      implementation of the SUT thresholds), otherwise by the scalar SUT.
+      Rows are validated like the SUT, so invalid inputs raise ValueError.
     - Result is 'Pass' if equal, else 'Fail'.
     """
-    rows = decision_table_rows()
-
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["ID", "Case", "Inputs", "Expected Output", "Actual Output", "Result"])
-        writer.writeheader()
-        for i, r in enumerate(rows, start=1):
-            inputs = {
-                "temp_c": r["Temp_C"],
-                "sal_psu": r["Sal_PSU"],
-                "do_mgL": r["DO_mgL"],
-                "nh3_mgL": r["NH3_mgL"],
-            }
-            expected = r["Expected_Risk"]
-            actual = classify_marine_health(**inputs)["risk"]
-            result = "Pass" if expected == actual else "Fail"
-            writer.writerow({
-                "ID": i,
-                "Case": r["Case"],
-                "Inputs": json.dumps(inputs, ensure_ascii=False),
-                "Expected Output": expected,
-                "Actual Output": actual,
-                "Result": result,
-            })
-    return path
+    return _write_results_csv(path, decision_table_rows())
 
 
 # ---------- Unit Tests ----------
@@ -155,39 +328,11 @@ class TestDecisionTableMarine(unittest.TestCase):
             self.assertEqual(out["risk"], r["Expected_Risk"], msg=f"Case {r['Case']} failed: {out}")
 
 class TestBoundaryValuesMarine(unittest.TestCase):
-    def test_temp_boundaries(self):
-        self.assertEqual(classify_marine_health(24.0, 32, 7, 0.0)["risk"], "low")
-        self.assertEqual(classify_marine_health(23.99, 32, 7, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(28.0, 32, 7, 0.0)["risk"], "low")
-        self.assertEqual(classify_marine_health(28.01, 32, 7, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(21.9, 32, 7, 0.0)["risk"], "high")
-        self.assertEqual(classify_marine_health(30.1, 32, 7, 0.0)["risk"], "high")
-
-    def test_sal_boundaries(self):
-        self.assertEqual(classify_marine_health(26, 30.0, 7, 0.0)["risk"], "low")
-        self.assertEqual(classify_marine_health(26, 29.99, 7, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 35.0, 7, 0.0)["risk"], "low")
-        self.assertEqual(classify_marine_health(26, 35.01, 7, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 27.9, 7, 0.0)["risk"], "high")
-        self.assertEqual(classify_marine_health(26, 37.1, 7, 0.0)["risk"], "high")
-
-    def test_do_boundaries(self):
-        self.assertEqual(classify_marine_health(26, 32, 6.0, 0.0)["risk"], "low")
-        self.assertEqual(classify_marine_health(26, 32, 5.99, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 32, 4.0, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 32, 3.99, 0.0)["risk"], "high")
-        self.assertEqual(classify_marine_health(26, 32, 1.99, 0.0)["risk"], "high")
-
-    def test_nh3_boundaries(self):
-        self.assertEqual(classify_marine_health(26, 32, 7, 0.02)["risk"], "low")
-        self.assertEqual(classify_marine_health(26, 32, 7, 0.02001)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 32, 7, 0.05)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26, 32, 7, 0.05001)["risk"], "high")
-
-    def test_aggregation_rules(self):
-        self.assertEqual(classify_marine_health(23.0, 29.0, 3.9, 0.04)["risk"], "high")
-        self.assertEqual(classify_marine_health(23.0, 32.0, 7.0, 0.0)["risk"], "medium")
-        self.assertEqual(classify_marine_health(26.0, 32.0, 7.0, 0.0)["risk"], "low")
+    def test_all_boundaries(self):
+        for r in boundary_cases_rows():
+            t, s, o, a = r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"]
+            with self.subTest(case=r["Case"], t=t, s=s, o=o, a=a):
+                self.assertEqual(classify_marine_health(t, s, o, a)["risk"], r["Expected_Risk"])
 
     def test_validation(self):
         with self.assertRaises(ValueError):
@@ -201,6 +346,46 @@ class TestBoundaryValuesMarine(unittest.TestCase):
         with self.assertRaises(ValueError):
             classify_marine_health(float("nan"), 32, 7, 0.0)
 
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestBatchMatchesSUT(unittest.TestCase):
+    def setUp(self):
+        rows = decision_table_rows() + boundary_cases_rows()
+        self.cols = [np.array([r[k] for r in rows], dtype=np.float64)
+                     for k in ("Temp_C", "Sal_PSU", "DO_mgL", "NH3_mgL")]
+        self.expected = [classify_marine_health(*vals)["risk"] for vals in zip(*(c.tolist() for c in self.cols))]
+
+    def test_jit_worker(self):
+        # Runs as plain Python when Numba is not installed
+        out = np.empty(len(self.expected), dtype=np.int8)
+        _classify_batch(*self.cols, out)
+        self.assertEqual(_RISK_ARR[out].tolist(), self.expected)
+
+    def test_searchsorted_worker(self):
+        self.assertEqual(_RISK_ARR[_classify_batch_np(*self.cols)].tolist(), self.expected)
+
+    def test_batch_api(self):
+        self.assertEqual(classify_marine_health_batch(*self.cols).tolist(), self.expected)
+
+class TestScalarFallback(unittest.TestCase):
+    def test_batch_risks_without_numpy(self):
+        global np
+        rows = decision_table_rows() + boundary_cases_rows()
+        expected = [classify_marine_health(r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"])["risk"] for r in rows]
+        saved, np = np, None
+        try:
+            self.assertEqual(_batch_risks(rows), expected)
+        finally:
+            np = saved
+
+@unittest.skipIf(_cclassify is None, "_marine_health extension not built")
+class TestNativeKernel(unittest.TestCase):
+    def test_kernel_matches_python(self):
+        for r in decision_table_rows() + boundary_cases_rows():
+            t, s, o, a = r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"]
+            with self.subTest(case=r["Case"]):
+                code, mask = _cclassify(t, s, o, a)
+                self.assertEqual((_RISK_LEVELS[code], _FACTORS_BY_MASK[mask]), _classify_python(t, s, o, a))
+
 # ---------- Boundary Test Case Enumeration & CSV ----------
 def boundary_cases_rows():
     """
@@ -253,43 +438,90 @@ def write_boundary_csv(path: str = "boundary_tests_marine_health.csv"):
     ID, Case, Inputs, Expected Output, Actual Output, Result
     for boundary test cases.
     """
-    rows = boundary_cases_rows()
-    import json, csv
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["ID", "Case", "Inputs", "Expected Output", "Actual Output", "Result"])
-        writer.writeheader()
-        for i, r in enumerate(rows, start=1):
-            inputs = {
-                "temp_c": r["Temp_C"],
-                "sal_psu": r["Sal_PSU"],
-                "do_mgL": r["DO_mgL"],
-                "nh3_mgL": r["NH3_mgL"],
-            }
-            expected = r["Expected_Risk"]
-            actual = classify_marine_health(**inputs)["risk"]
-            result = "Pass" if expected == actual else "Fail"
-            writer.writerow({
-                "ID": i,
-                "Case": r["Case"],
-                "Inputs": json.dumps(inputs, ensure_ascii=False),
-                "Expected Output": expected,
-                "Actual Output": actual,
-                "Result": result,
-            })
-    return path
+    return _write_results_csv(path, boundary_cases_rows())
+
+
+# ---------- Golden-file Regression ----------
+# SHA-256 over the (Inputs, Expected Output) columns of both tables, in order.
+# It only changes when a table changes; update it with `--regenerate` then.
+# The SUT's output is not part of the hash, and --verify-only trusts the
+# Result column recorded in the CSVs, so a SUT regression is only caught by
+# regenerating the CSVs or running the unit tests.
+_GOLDEN_HASH = "11941978a345855b738310be0741f506624e0d4c56be4efb58db3cde71a1c79c"
+_CSV_PATHS = ("decision_table_marine_health.csv", "boundary_tests_marine_health.csv")
+
+
+def _golden_digest(pairs) -> str:
+    h = hashlib.sha256()
+    for inputs, expected in pairs:
+        h.update(f"{inputs}\t{expected}\n".encode("utf-8"))
+    return h.hexdigest()
+
 
+def _table_digest() -> str:
+    """Digest of the in-code tables (no classification involved)."""
+    return _golden_digest(
+        (_INPUT_FMT.format(r["Temp_C"], r["Sal_PSU"], r["DO_mgL"], r["NH3_mgL"]), r["Expected_Risk"])
+        for r in decision_table_rows() + boundary_cases_rows()
+    )
+
+
+def verify_golden_csvs(paths=_CSV_PATHS) -> bool:
+    """
+    Check previously written CSVs without calling the SUT:
+    the tables still hash to _GOLDEN_HASH, the files on disk hash to the
+    same value, and every recorded Result is 'Pass'.  Recorded results are
+    trusted as-is, so this cannot detect a change in the SUT itself.
+    A missing CSV counts as a mismatch.
+    """
+    pairs = []
+    all_pass = True
+    for path in paths:
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    pairs.append((row["Inputs"], row["Expected Output"]))
+                    all_pass = all_pass and row["Result"] == "Pass"
+        except FileNotFoundError:
+            print(f"[VERIFY] missing CSV: {path}")
+            return False
+    return _table_digest() == _GOLDEN_HASH and _golden_digest(pairs) == _GOLDEN_HASH and all_pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--verify-only", action="store_true",
+                      help="compare existing CSVs against the golden hash without running the SUT "
+                           "(trusts the recorded Result column; cannot detect SUT regressions)")
+    mode.add_argument("--regenerate", action="store_true",
+                      help="rewrite both CSVs and print the new golden hash; skip the unit tests")
+    args = parser.parse_args(argv)
+
+    if args.verify_only:
+        ok = verify_golden_csvs()
+        print(f"[VERIFY] golden={_GOLDEN_HASH} match={ok}")
+        if not ok:
+            raise SystemExit(1)
+        return
 
-def main():
     # Write decision table CSV alongside the script when run directly
     csv_path_decision_table = write_decision_table_csv("decision_table_marine_health.csv")
     print(f"[INFO] Wrote decision table: {csv_path_decision_table}")
     csv_path_boundary = write_boundary_csv("boundary_tests_marine_health.csv")
     print(f"[INFO] Wrote decision table: {csv_path_boundary}")
 
+    if args.regenerate:
+        print(f"[INFO] Golden hash: {_table_digest()}")
+        return
+
     # Run tests
     suite = unittest.TestLoader().loadTestsFromTestCase(TestDecisionTableMarine)
     suite2 = unittest.TestLoader().loadTestsFromTestCase(TestBoundaryValuesMarine)
-    alltests = unittest.TestSuite([suite, suite2])
+    suite3 = unittest.TestLoader().loadTestsFromTestCase(TestBatchMatchesSUT)
+    suite4 = unittest.TestLoader().loadTestsFromTestCase(TestNativeKernel)
+    suite5 = unittest.TestLoader().loadTestsFromTestCase(TestScalarFallback)
+    alltests = unittest.TestSuite([suite, suite2, suite3, suite4, suite5])
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(alltests)
 
@@ -297,4 +529,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build-only script for the optional native kernel used by marine_health_testing.py:
+
+    pip install Cython setuptools
+    python setup.py build_ext --inplace
+
+This is not an installable package (`pip install .` is not supported).
+The scripts run without the kernel (pure-Python fallback).
+Cython compiler directives live in the header of _marine_health.pyx.
+"""
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required to build _marine_health: pip install Cython")
+
+setup(
+    name="marine-health-check",
+    ext_modules=cythonize([Extension("_marine_health", ["_marine_health.pyx"])]),
+)